@@ -5,6 +5,12 @@ except ImportError:
 
 import math
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 
 # -------------------------------------------------------
 # Game parameters
@@ -21,7 +27,6 @@ class Params:
         AIRCRAFT_FLY_TIME = 10.0
         MAX_AIRCRAFT = 5
         AIRCRAFT_CAN_FLY_AGAIN = 5.0
-        AIRCRAFT_COUNT = 0
         FLY_AROUND_TARGET = 10
 
 
@@ -30,6 +35,7 @@ class Params:
 # -------------------------------------------------------
 
 class Vector2:
+    __slots__ = ('x', 'y')
 
     def __init__(self, *args):
         if not args:
@@ -48,6 +54,25 @@ class Vector2:
     def __sub__(self, other):
         return Vector2(self.x - other.x, self.y - other.y)
 
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, coef):
+        self.x *= coef
+        self.y *= coef
+        return self
+
+    def set(self, x, y):
+        self.x = x
+        self.y = y
+
     def magnitude(self):
         return math.hypot(self.x, self.y)
 
@@ -63,14 +88,18 @@ class Vector2:
 # -------------------------------------------------------
 
 class Ship:
+    __slots__ = ('_model', 'position', '_angle', '_fwd', '_back', '_left', '_right')
+
+    _KEYMAP = {
+        framework.Keys.FORWARD: '_fwd', framework.Keys.BACKWARD: '_back', framework.Keys.LEFT: '_left',
+        framework.Keys.RIGHT: '_right'
+    }
+
     def __init__(self):
         self._model = None
         self.position = None
         self._angle = 0.0
-        self._input = {
-            framework.Keys.FORWARD: False, framework.Keys.BACKWARD: False, framework.Keys.LEFT: False,
-            framework.Keys.RIGHT: False
-        }
+        self._fwd = self._back = self._left = self._right = False
 
     def init(self):
         assert not self._model
@@ -84,52 +113,153 @@ class Ship:
         self._model = None
 
     def update(self, dt):
+        shipLinearSpeed, shipAngularSpeed = Params.Ship.LINEAR_SPEED, Params.Ship.ANGULAR_SPEED
         linearSpeed, angularSpeed = 0.0, 0.0
 
-        if self._input[framework.Keys.FORWARD]:
-            linearSpeed = Params.Ship.LINEAR_SPEED
-        elif self._input[framework.Keys.BACKWARD]:
-            linearSpeed = -Params.Ship.LINEAR_SPEED
+        if self._fwd:
+            linearSpeed = shipLinearSpeed
+        elif self._back:
+            linearSpeed = -shipLinearSpeed
 
-        if self._input[framework.Keys.LEFT] and linearSpeed != 0.0:
-            angularSpeed = Params.Ship.ANGULAR_SPEED
-        elif self._input[framework.Keys.RIGHT] and linearSpeed != 0.0:
-            angularSpeed = -Params.Ship.ANGULAR_SPEED
+        if self._left and linearSpeed != 0.0:
+            angularSpeed = shipAngularSpeed
+        elif self._right and linearSpeed != 0.0:
+            angularSpeed = -shipAngularSpeed
 
         self._angle = self._angle + angularSpeed * dt
-        self.position = (self.position + Vector2(math.cos(self._angle), math.sin(self._angle)) * linearSpeed * dt)
+        step = linearSpeed * dt
+        self.position.x += math.cos(self._angle) * step
+        self.position.y += math.sin(self._angle) * step
         framework.placeModel(self._model, self.position.x, self.position.y, self._angle)
 
     def key_pressed(self, key):
-        self._input[key] = True
+        attr = self._KEYMAP.get(key)
+        if attr:
+            setattr(self, attr, True)
 
     def key_released(self, key):
-        self._input[key] = False
+        attr = self._KEYMAP.get(key)
+        if attr:
+            setattr(self, attr, False)
 
     def mouse_clicked(self, x, y, is_left_button):
         if not is_left_button:
             framework.placeGoalModel(x, y)
 
 
+# -------------------------------------------------------
+# Aircraft kinematics
+# -------------------------------------------------------
+
+_ORBIT_RADIUS = 0.7
+_ORBIT_SPEED = 0.8
+_ORBIT_BLEND_TIME = 50.0
+_ORBIT_TRANSITION = 0.1
+_ROTATE_TIME = 5.0
+_FLY_TIME = Params.Aircraft.AIRCRAFT_FLY_TIME
+
+_INV_FLY = 1.0 / _FLY_TIME
+_INV_ROTATE = 1.0 / _ROTATE_TIME
+_INV_ORBIT_BLEND = 1.0 / _ORBIT_BLEND_TIME
+
+
+@njit(cache=True, fastmath=True)
+def _step_to_target(pos_x, pos_y, target_x, target_y, time_since_takeoff, dt, linear_speed):
+    dx = target_x - pos_x
+    dy = target_y - pos_y
+    distance = math.sqrt(dx * dx + dy * dy)
+    inv = 1.0 / distance if distance else 0.0
+    dxn, dyn = dx * inv, dy * inv
+    interpolation_factor = time_since_takeoff * _INV_FLY
+    if interpolation_factor > 1.0:
+        interpolation_factor = 1.0
+    step = linear_speed * dt * interpolation_factor
+    return pos_x + dxn * step, pos_y + dyn * step, math.atan2(dyn, dxn), distance
+
+
+@njit(cache=True, fastmath=True)
+def _step_orbit(pos_x, pos_y, target_x, target_y, orbit_time, orbit_cos, orbit_sin, step_cos, step_sin):
+    orbit_cos, orbit_sin = orbit_cos * step_cos - orbit_sin * step_sin, orbit_cos * step_sin + orbit_sin * step_cos
+    interpolation_factor = orbit_time * _INV_ORBIT_BLEND
+    if interpolation_factor > 1.0:
+        interpolation_factor = 1.0
+
+    dx = target_x + orbit_cos * _ORBIT_RADIUS - pos_x
+    dy = target_y + orbit_sin * _ORBIT_RADIUS - pos_y
+    angle_to_center = math.atan2(dy, dx)
+    return (
+        pos_x + dx * interpolation_factor, pos_y + dy * interpolation_factor, angle_to_center, orbit_cos, orbit_sin
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _step_return(pos_x, pos_y, base_x, base_y, angle, return_time, dt, linear_speed):
+    dx = base_x - pos_x
+    dy = base_y - pos_y
+    distance_to_base = math.sqrt(dx * dx + dy * dy)
+    inv = 1.0 / distance_to_base if distance_to_base else 0.0
+    dxn, dyn = dx * inv, dy * inv
+
+    target_angle = math.atan2(dyn, dxn)
+    rotation_progress = return_time * _INV_ROTATE
+    if rotation_progress > 1.0:
+        rotation_progress = 1.0
+    angle = angle + (target_angle - angle) * rotation_progress
+
+    interpolation_factor = return_time * _INV_FLY
+    if interpolation_factor > 1.0:
+        interpolation_factor = 1.0
+    step = linear_speed * dt * interpolation_factor
+    remaining_speed = linear_speed * (1.0 - interpolation_factor)
+    return pos_x + dxn * step, pos_y + dyn * step, angle, remaining_speed, distance_to_base
+
+
 # -------------------------------------------------------
 # Simple aircraft logic
 # -------------------------------------------------------
 
+_TO_TARGET, _ORBIT, _RETURN, _LANDED = range(4)
+
+
 class Aircraft:
-    def __init__(self, position, angle):
+    __slots__ = (
+        '_model', 'position', '_angle', 'target', 'time_since_takeoff', 'is_landed', 'time_since_landing',
+        'refuel_time', 'flight_phase', 'orbit_start_time', 'return_to_base_start_time',
+        'should_orbit_around_target', 'linear_speed', '_orbit_cos', '_orbit_sin', '_orbit_dt', '_orbit_dc',
+        '_orbit_ds'
+    )
+
+    def __init__(self):
         self._model = None
-        self.position = Vector2(position.x, position.y)
-        self._angle = angle
-        self.target = None
+        self.position = Vector2()
+        self._angle = 0.0
+        self.target = Vector2()
         self.time_since_takeoff = 0.0
         self.is_landed = True
         self.time_since_landing = None
         self.refuel_time = 5.0
-        self.flight_phase = "to_target"
+        self.flight_phase = _LANDED
         self.orbit_start_time = 0.0
         self.return_to_base_start_time = 0.0
         self.should_orbit_around_target = False
         self.linear_speed = 2.0
+        self._orbit_cos = 1.0
+        self._orbit_sin = 0.0
+        self._orbit_dt = None
+        self._orbit_dc = None
+        self._orbit_ds = None
+
+    def reset(self, position, angle, target_x, target_y):
+        self.position.set(position.x, position.y)
+        self._angle = angle
+        self.target.set(target_x, target_y)
+        self.flight_phase = _TO_TARGET
+        self.orbit_start_time = 0.0
+        self.return_to_base_start_time = 0.0
+        self.should_orbit_around_target = False
+        self.linear_speed = Params.Aircraft.LINEAR_SPEED
+        self._orbit_cos = 1.0
+        self._orbit_sin = 0.0
 
     def takeoff(self):
         if self.is_landed:
@@ -146,96 +276,74 @@ class Aircraft:
             self.time_since_landing = 0.0
 
     def refuel(self, dt):
-        if not self.is_landed or self.time_since_takeoff is None:
+        if not self.is_landed or self.time_since_landing is None:
             return False
         self.time_since_landing += dt
         if self.time_since_landing >= self.refuel_time:
-            Params.Aircraft.AIRCRAFT_COUNT -= 1
+            self.time_since_landing = None
             return True
         return False
 
-    def update(self, dt, ship_position_x, ship_position_y):
-        if not self.is_landed:
-            if self.flight_phase == "to_target":
-                self.time_since_takeoff += dt
-                if self.time_since_takeoff > Params.Aircraft.AIRCRAFT_FLY_TIME:
-                    self.flight_phase = "return_to_base"
-                else:
-                    direction = Vector2(self.target - self.position)
-                    distance = direction.magnitude()
-                    direction.normalize()
-                    interpolation_factor = min(1.0, self.time_since_takeoff / Params.Aircraft.AIRCRAFT_FLY_TIME)
-                    movement = direction * Params.Aircraft.LINEAR_SPEED * dt * interpolation_factor
-                    self.position += movement
-                    self._angle = math.atan2(direction.y, direction.x)
-
-                    if self._model:
-                        framework.placeModel(self._model, self.position.x, self.position.y, self._angle)
-                    if distance <= 0.1:
-                        if self.should_orbit_around_target:
-                            self.flight_phase = "orbit_around_target"
-                            self.orbit_start_time = 0.
-                        else:
-                            self.flight_phase = "return_to_base"
-                            self.return_to_base_start_time = 0
-
-            elif self.flight_phase == "orbit_around_target":
-                if not self.should_orbit_around_target:
-                    self.flight_phase = "return_to_base"
-                    self.return_to_base_start_time = 0.0
-                else:
-                    self.orbit_start_time += dt
-                    orbit_radius = 0.7
-                    orbit_speed = 0.8
-                    orbit_angle = self.orbit_start_time * orbit_speed
-                    interpolation_factor = min(1.0, self.orbit_start_time / 50.0)
-
-                    relative_target_position = Vector2(math.cos(orbit_angle), math.sin(orbit_angle)) * orbit_radius
-                    target_position = self.target + relative_target_position
-
-                    direction = Vector2(target_position - self.position)
-                    direction.normalize()
-
-                    angle_to_center = math.atan2(direction.y, direction.x)
-                    self.position = self.position + (target_position - self.position) * interpolation_factor
-
-                    if self._model:
-                        framework.placeModel(self._model, self.position.x, self.position.y, angle_to_center)
+    def update(self, dt, ship_position_x, ship_position_y, place_model):
+        if self.is_landed:
+            return self.refuel(dt)
+        assert self._model
 
-                    if self.orbit_start_time >= Params.Aircraft.FLY_AROUND_TARGET:
-                        self.flight_phase = "return_to_base"
+        linear_speed = Params.Aircraft.LINEAR_SPEED
+        fly_around = Params.Aircraft.FLY_AROUND_TARGET
+        position = self.position
+
+        if self.flight_phase == _TO_TARGET:
+            self.time_since_takeoff += dt
+            if self.time_since_takeoff > _FLY_TIME:
+                self.flight_phase = _RETURN
+            else:
+                position.x, position.y, self._angle, distance = _step_to_target(
+                    position.x, position.y, self.target.x, self.target.y, self.time_since_takeoff, dt, linear_speed
+                )
+
+                place_model(self._model, position.x, position.y, self._angle)
+                if distance <= _ORBIT_TRANSITION:
+                    if self.should_orbit_around_target:
+                        self.flight_phase = _ORBIT
+                        self.orbit_start_time = 0.
+                        self._orbit_cos, self._orbit_sin = 1.0, 0.0
+                    else:
+                        self.flight_phase = _RETURN
                         self.return_to_base_start_time = 0.0
 
-            elif self.flight_phase == "return_to_base":
-                self.return_to_base_start_time += dt
-                base_position = Vector2(ship_position_x, ship_position_y)
-                direction_to_base = Vector2(base_position - self.position)
-                distance_to_base = direction_to_base.magnitude()
-                direction_to_base.normalize()
-
-                target_angle = math.atan2(direction_to_base.y, direction_to_base.x)
-                time_to_rotate = 5.0
-                rotation_progress = min(1.0, self.return_to_base_start_time / time_to_rotate)
-                self._angle = self._angle + (target_angle - self._angle) * rotation_progress
-
-                interpolation_factor = min(1.0, self.return_to_base_start_time / Params.Aircraft.AIRCRAFT_FLY_TIME)
-                movement_to_base = direction_to_base * Params.Aircraft.LINEAR_SPEED * dt * interpolation_factor
-                self.linear_speed = Params.Aircraft.LINEAR_SPEED * (1.0 - interpolation_factor)
-                self.position += movement_to_base
-
-                if self._model:
-                    framework.placeModel(self._model, self.position.x, self.position.y, self._angle)
-                orbit_transition_distance = 0.1
-                if distance_to_base <= orbit_transition_distance:
-                    self.flight_phase = "landed"
-                    self.landed()
+        elif self.flight_phase == _ORBIT:
+            if not self.should_orbit_around_target:
+                self.flight_phase = _RETURN
+                self.return_to_base_start_time = 0.0
+            else:
+                self.orbit_start_time += dt
+                if dt != self._orbit_dt:
+                    self._orbit_dt = dt
+                    self._orbit_dc, self._orbit_ds = math.cos(_ORBIT_SPEED * dt), math.sin(_ORBIT_SPEED * dt)
+                position.x, position.y, angle_to_center, self._orbit_cos, self._orbit_sin = _step_orbit(
+                    position.x, position.y, self.target.x, self.target.y, self.orbit_start_time,
+                    self._orbit_cos, self._orbit_sin, self._orbit_dc, self._orbit_ds
+                )
+
+                place_model(self._model, position.x, position.y, angle_to_center)
+
+                if self.orbit_start_time >= fly_around:
+                    self.flight_phase = _RETURN
+                    self.return_to_base_start_time = 0.0
 
-        else:
-            if self.refuel(dt):
-                self.takeoff()
-            if self._model:
-                framework.destroyModel(self._model)
-                self._model = None
+        elif self.flight_phase == _RETURN:
+            self.return_to_base_start_time += dt
+            position.x, position.y, self._angle, self.linear_speed, distance_to_base = _step_return(
+                position.x, position.y, ship_position_x, ship_position_y, self._angle,
+                self.return_to_base_start_time, dt, linear_speed
+            )
+
+            place_model(self._model, position.x, position.y, self._angle)
+            if distance_to_base <= _ORBIT_TRANSITION:
+                self.flight_phase = _LANDED
+                self.landed()
+        return False
 
 
 # -------------------------------------------------------
@@ -247,17 +355,24 @@ class Game:
     def __init__(self):
         self._ship = Ship()
         self.aircraft_list = []
+        self._free = []
 
     def init(self):
         self._ship.init()
+        self.aircraft_list = [Aircraft() for _ in range(Params.Aircraft.MAX_AIRCRAFT)]
+        self._free = list(self.aircraft_list)
 
     def deinit(self):
         self._ship.deinit()
 
     def update(self, dt):
         self._ship.update(dt)
+        ship_position = self._ship.position
+        ship_position_x, ship_position_y = ship_position.x, ship_position.y
+        place_model = framework.placeModel
         for aircraft in self.aircraft_list:
-            aircraft.update(dt, self._ship.position.x, self._ship.position.y)
+            if aircraft.update(dt, ship_position_x, ship_position_y, place_model):
+                self._free.append(aircraft)
 
     def keyPressed(self, key):
         self._ship.key_pressed(key)
@@ -267,20 +382,18 @@ class Game:
 
     def mouseClicked(self, x, y, is_left_button):
         self._ship.mouse_clicked(x, y, is_left_button)
-        aircraft = Aircraft(self._ship.position, 0.0)
-        orbiting_aircraft = any(aircraft.flight_phase == "orbit_around_target" for aircraft in self.aircraft_list)
         if is_left_button:
-            if Params.Aircraft.AIRCRAFT_COUNT < Params.Aircraft.MAX_AIRCRAFT:
-                aircraft.target = Vector2(x, y)
+            if self._free:
+                aircraft = self._free.pop()
+                aircraft.reset(self._ship.position, 0.0, x, y)
                 aircraft.takeoff()
-                Params.Aircraft.AIRCRAFT_COUNT += 1
-                self.aircraft_list.append(aircraft)
         else:
+            orbiting_aircraft = any(other.flight_phase == _ORBIT for other in self.aircraft_list)
             for aircraft in self.aircraft_list:
                 aircraft.should_orbit_around_target = True
-                aircraft.target = Vector2(x, y)
+                aircraft.target.set(x, y)
                 if orbiting_aircraft:
-                    aircraft.flight_phase = "to_target"
+                    aircraft.flight_phase = _TO_TARGET
 
 
 # -------------------------------------------------------